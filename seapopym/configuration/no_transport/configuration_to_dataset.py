@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import attrs
@@ -23,11 +24,13 @@ if TYPE_CHECKING:
 
 def _as_dataset__load_forcings(forcing_parameters: ForcingParameters) -> xr.Dataset:
     """Return the forcings as a xarray.Dataset."""
-    all_forcing = {
-        forcing_key: forcing_value["forcing"]
-        for forcing_key, forcing_value in attrs.asdict(forcing_parameters).items()
-        if forcing_value is not None and forcing_key not in ["timestep", "resolution"]
-    }
+    all_forcing = {}
+    for field in attrs.fields(type(forcing_parameters)):
+        if field.name in ("timestep", "resolution"):
+            continue
+        forcing_unit = getattr(forcing_parameters, field.name)
+        if forcing_unit is not None:
+            all_forcing[field.name] = forcing_unit.forcing
     all_forcing[ConfigurationLabels.timestep] = forcing_parameters.timestep
     all_forcing[ConfigurationLabels.resolution_latitude] = forcing_parameters.resolution[0]
     all_forcing[ConfigurationLabels.resolution_longitude] = forcing_parameters.resolution[1]
@@ -43,48 +46,66 @@ def _as_dataset__build_fgroup_dataset__generate_param_coords(
     xarray.DataArray.
     """
 
-    def _rec_parameters(data: list) -> dict:
-        """Recursivaly list all parameters."""
+    def _flatten_parameters(instances: list) -> dict:
+        """
+        List all parameters. Nested Attrs dataclasses are walked using a stack rather than recursion and their
+        attributs are read directly (no intermediate dictionaries).
+        """
         all_param = {}
-        for key in data[0]:
-            if not isinstance(data[0][key], dict):
-                all_param[key] = [dic[key] for dic in data]
-            else:
-                all_param.update(_rec_parameters([dic[key] for dic in data]))
+        stack = [instances]
+        while stack:
+            current = stack.pop()
+            for field in attrs.fields(type(current[0])):
+                values = [getattr(instance, field.name) for instance in current]
+                if attrs.has(type(values[0])):
+                    stack.append(values)
+                else:
+                    all_param[field.name] = values
         return all_param
 
     # 1. Generate a dictionary with all parameters as list
-    grps_param = _rec_parameters([attrs.asdict(grp) for grp in functional_groups])
+    grps_param = _flatten_parameters(functional_groups)
 
     # 2. Generate the coordinates (i.e. functional groups)
-    f_group_coord_data = list(range(len(grps_param["name"])))
+    f_group_coord_data = np.arange(len(grps_param["name"]), dtype=np.int32)
     f_group_coord = xr.DataArray(
         coords=(f_group_coord_data,),
         dims=(CoordinatesLabels.functional_group,),
         name=CoordinatesLabels.functional_group,
-        attrs=functional_group_desc(f_group_coord_data, grps_param["name"]),
+        attrs=functional_group_desc(f_group_coord_data.tolist(), grps_param["name"]),
         data=f_group_coord_data,
     )
 
     return grps_param, f_group_coord
 
 
+@lru_cache(maxsize=None)
+def _fields_by_name(param_class: type) -> dict[str, attrs.Attribute]:
+    """Map the name of each attribut of an Attrs dataclass to its definition. Cached since classes do not change."""
+    return {field.name: field for field in attrs.fields(param_class)}
+
+
 def _as_dataset__build_fgroup_dataset__generate_variables(
-    params: dict, classes_and_names: list[tuple[attrs.Attribute, str]]
-) -> dict[str, tuple]:
+    params: dict, classes_and_names: list[tuple[attrs.Attribute, str]], f_group_coord: xr.DataArray
+) -> dict[str, xr.DataArray]:
     """
-    Generate a dictionary where each key is a variable name and each value is a tuple of parameters. It can be used
-    to create a xr.Dataset.
+    Generate a dictionary where each key is a variable name and each value is a xarray.DataArray indexed by the
+    functional groups coordinates. It can be used to create a xr.Dataset.
     """
 
     def _sel_attrs_meta(param_class: attrs.Attribute, attribut: str) -> dict:
         """Extract metadata from a specific attribut in an Attrs dataclass."""
-        return next(filter(lambda x: x.name == attribut, attrs.fields(param_class))).metadata
+        return _fields_by_name(param_class)[attribut].metadata
 
-    def _generate_tuple(param_class: attrs.Attribute, name: str) -> tuple:
-        return ((CoordinatesLabels.functional_group,), params[name], _sel_attrs_meta(param_class, name))
+    def _generate_data_array(param_class: attrs.Attribute, name: str) -> xr.DataArray:
+        return xr.DataArray(
+            np.asarray(params[name]),
+            dims=(CoordinatesLabels.functional_group,),
+            coords={CoordinatesLabels.functional_group: f_group_coord},
+            attrs=_sel_attrs_meta(param_class, name),
+        )
 
-    return {name: _generate_tuple(cls, name) for cls, name in classes_and_names}
+    return {name: _generate_data_array(cls, name) for cls, name in classes_and_names}
 
 
 def _as_dataset__build_fgroup_dataset(functional_groups: list[FunctionalGroupUnit]) -> xr.Dataset:
@@ -108,66 +129,83 @@ def _as_dataset__build_fgroup_dataset(functional_groups: list[FunctionalGroupUni
         (FunctionalGroupUnitMigratoryParameters, ConfigurationLabels.day_layer),
         (FunctionalGroupUnitMigratoryParameters, ConfigurationLabels.night_layer),
     ]
-    param_variables = _as_dataset__build_fgroup_dataset__generate_variables(param_as_dict, names_classes)
-    return xr.Dataset(param_variables, coords={CoordinatesLabels.functional_group: f_group_coord})
+    param_variables = _as_dataset__build_fgroup_dataset__generate_variables(param_as_dict, names_classes, f_group_coord)
+    return xr.Dataset(data_vars=param_variables, coords={CoordinatesLabels.functional_group: f_group_coord})
 
 
-def _as_dataset__build_cohort_dataset___cohort_by_fgroup(fgroup: int, timesteps_number: list[int]) -> xr.Dataset:
+def _as_dataset__build_cohort_dataset___cohort_by_fgroup(timesteps_number: list[int]) -> dict[str, np.ndarray]:
     """
-    Build the cohort axis for a specific functional group using the `timesteps_number` parameter given by the
+    Compute the cohort parameters for a specific functional group using the `timesteps_number` parameter given by the
     user.
     """
-    cohort_index = new_cohort(np.arange(0, len(timesteps_number), 1, dtype=int))
+    timesteps_number = np.asarray(timesteps_number, dtype=np.int32)
     max_timestep = np.cumsum(timesteps_number)
-    min_timestep = max_timestep - (np.asarray(timesteps_number) - 1)
-    mean_timestep = (max_timestep + min_timestep) / 2
+    min_timestep = max_timestep - timesteps_number + 1
+    mean_timestep = (max_timestep + min_timestep) * 0.5
+    return {
+        ConfigurationLabels.timesteps_number: timesteps_number,
+        ConfigurationLabels.min_timestep: min_timestep,
+        ConfigurationLabels.max_timestep: max_timestep,
+        ConfigurationLabels.mean_timestep: mean_timestep,
+    }
 
-    data_vars = {
+
+def _as_dataset__build_cohort_dataset___stack(arrays: list[np.ndarray], size: int) -> np.ndarray:
+    """Stack the cohort parameters of all functional groups. Missing cohorts are filled with NaN."""
+    stacked = np.full((len(arrays), size), np.nan)
+    for index, array in enumerate(arrays):
+        stacked[index, : array.size] = array
+    return stacked
+
+
+def _as_dataset__build_cohort_dataset(functional_groups: list[FunctionalGroupUnit], names: xr.DataArray) -> xr.Dataset:
+    """
+    Return the cohort parameters as a xarray.Dataset.
+
+    Notes
+    -----
+    Functional groups can have a different number of cohorts. In that case the cohort axis has the size of the longest
+    one and the others are filled with NaN.
+
+    """
+    name_to_index = dict(zip(names.data.tolist(), names[CoordinatesLabels.functional_group].data.tolist()))
+    all_index = [name_to_index[fgroup.name] for fgroup in functional_groups]
+    all_cohorts = [
+        _as_dataset__build_cohort_dataset___cohort_by_fgroup(fgroup.functional_type.cohorts_timesteps)
+        for fgroup in functional_groups
+    ]
+    nb_cohorts = max(cohorts[ConfigurationLabels.timesteps_number].size for cohorts in all_cohorts)
+
+    descriptions = {
         ConfigurationLabels.timesteps_number: (
-            (CoordinatesLabels.functional_group, CoordinatesLabels.cohort),
-            [timesteps_number],
-            {
-                "description": (
-                    "The number of timesteps represented in the cohort. If there is no aggregation, all values are "
-                    "equal to 1."
-                )
-            },
-        ),
-        ConfigurationLabels.min_timestep: (
-            (CoordinatesLabels.functional_group, CoordinatesLabels.cohort),
-            [min_timestep],
-            {"description": "The minimum timestep index."},
+            "The number of timesteps represented in the cohort. If there is no aggregation, all values are equal to 1."
         ),
-        ConfigurationLabels.max_timestep: (
-            (CoordinatesLabels.functional_group, CoordinatesLabels.cohort),
-            [max_timestep],
-            {"description": "The maximum timestep index."},
-        ),
-        ConfigurationLabels.mean_timestep: (
+        ConfigurationLabels.min_timestep: "The minimum timestep index.",
+        ConfigurationLabels.max_timestep: "The maximum timestep index.",
+        ConfigurationLabels.mean_timestep: "The mean timestep index.",
+    }
+    data_vars = {
+        name: (
             (CoordinatesLabels.functional_group, CoordinatesLabels.cohort),
-            [mean_timestep],
-            {"description": "The mean timestep index."},
-        ),
+            _as_dataset__build_cohort_dataset___stack([cohorts[name] for cohorts in all_cohorts], nb_cohorts),
+            {"description": description},
+        )
+        for name, description in descriptions.items()
     }
 
     return xr.Dataset(
-        coords={CoordinatesLabels.functional_group: fgroup, CoordinatesLabels.cohort: cohort_index},
+        coords={
+            CoordinatesLabels.functional_group: (
+                CoordinatesLabels.functional_group,
+                np.asarray(all_index, dtype=names[CoordinatesLabels.functional_group].dtype),
+                names[CoordinatesLabels.functional_group].attrs,
+            ),
+            CoordinatesLabels.cohort: new_cohort(np.arange(0, nb_cohorts, 1, dtype=int)),
+        },
         data_vars=data_vars,
     )
 
 
-def _as_dataset__build_cohort_dataset(functional_groups: list[FunctionalGroupUnit], names: xr.DataArray) -> xr.Dataset:
-    """Return the cohort parameters as a xarray.Dataset."""
-    all_cohorts_timesteps = [fgroup.functional_type.cohorts_timesteps for fgroup in functional_groups]
-    all_index = [names[CoordinatesLabels.functional_group][names == fgroup.name] for fgroup in functional_groups]
-    return xr.merge(
-        [
-            _as_dataset__build_cohort_dataset___cohort_by_fgroup(grp_index, timesteps)
-            for grp_index, timesteps in zip(all_index, all_cohorts_timesteps)
-        ]
-    )
-
-
 def as_dataset(functional_groups: list[FunctionalGroupUnit], forcing_parameters: ForcingParameters) -> xr.Dataset:
     """Return the configuration as a xarray.Dataset."""
     fgroup = _as_dataset__build_fgroup_dataset(functional_groups=functional_groups)
@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Callable, Iterable, ParamSpecArgs, ParamSpecKw
 
 import cf_xarray  # noqa: F401
 import dask.array as da
+import numpy as np
 import xarray as xr
 from attr import define, field, validators
 
@@ -44,6 +45,9 @@ class ForcingTemplate(BaseTemplate):
     attrs: ForcingAttrs
     dims: Iterable[SeapopymDims | SeapopymForcing] = field(validator=validators.instance_of(Iterable))
     chunks: dict[str, int] | None = None
+    # The type of the template must match the one returned by the function. It can depend on the state (e.g. the type
+    # of a forcing). If None, the template is float64.
+    dtype: Callable[[SeapopymState], np.dtype] | None = None
 
     @dims.validator
     def _validate_dims(self, attribute, value) -> None:
@@ -71,8 +75,9 @@ class ForcingTemplate(BaseTemplate):
         else:
             ordered_chunks = {}
 
+        dtype = np.float64 if self.dtype is None else self.dtype(state)
         template = xr.DataArray(
-            da.empty(coords_size, chunks=ordered_chunks),
+            da.empty(coords_size, chunks=ordered_chunks, dtype=dtype),
             coords=coords,
             dims=coords_name,
             name=self.name,
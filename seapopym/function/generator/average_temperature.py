@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import cf_xarray  # noqa: F401
+import numpy as np
 import xarray as xr
+from numba import jit
 
 from seapopym.function.core.kernel import KernelUnits
 from seapopym.function.core.template import ForcingTemplate
@@ -11,6 +13,45 @@ from seapopym.standard.labels import ConfigurationLabels, CoordinatesLabels, For
 from seapopym.standard.units import StandardUnitsLabels, check_units
 
 
+@jit
+def _mix_layers(
+    temperature: np.ndarray, day_length: np.ndarray, day_position: np.ndarray, night_position: np.ndarray
+) -> np.ndarray:
+    """
+    Gather the day and night layers of each functional group and weight them by the day length in a single pass.
+
+    Parameters
+    ----------
+    temperature : np.ndarray
+        The temperature. Dims : (N, L) where N is the flattened (T, Y, X) space. C-contiguous.
+    day_length : np.ndarray
+        The day length. Dims : (N,). C-contiguous.
+    day_position, night_position : np.ndarray
+        The position of the day/night layer of each functional group along L. Dims : (F,).
+
+    Returns
+    -------
+    average_temperature : np.ndarray
+        Dims : (F, N). Same type as the temperature, which must be a float array.
+
+    """
+    average_temperature = np.empty((day_position.size, temperature.shape[0]), dtype=temperature.dtype)
+    for fgroup in range(day_position.size):
+        for cell in range(temperature.shape[0]):
+            average_temperature[fgroup, cell] = (day_length[cell] * temperature[cell, day_position[fgroup]]) + (
+                (1 - day_length[cell]) * temperature[cell, night_position[fgroup]]
+            )
+    return average_temperature
+
+
+def _average_temperature_dtype(state: xr.Dataset) -> np.dtype:
+    """
+    Return the type of the average temperature. The temperature precision is kept but integers are promoted to
+    floats. It only depends on the temperature so it is known before the day length is computed.
+    """
+    return np.result_type(state[ForcingLabels.temperature].dtype, np.float32)
+
+
 def _average_temperature(state: xr.Dataset) -> xr.DataArray:
     """
     Depend on:
@@ -34,17 +75,44 @@ def _average_temperature(state: xr.Dataset) -> xr.DataArray:
     day_layer = state[ConfigurationLabels.day_layer]
     night_layer = state[ConfigurationLabels.night_layer]
 
-    average_temperature = []
-    for fgroup in day_layer[CoordinatesLabels.functional_group]:
-        day_temperature = temperature.cf.sel(Z=day_layer.sel({CoordinatesLabels.functional_group: fgroup}))
-        night_temperature = temperature.cf.sel(Z=night_layer.sel({CoordinatesLabels.functional_group: fgroup}))
-        mean_temperature = (day_length * day_temperature) + ((1 - day_length) * night_temperature)
-        if "Z" in mean_temperature.cf:
-            mean_temperature = mean_temperature.cf.drop_vars("Z")
-        mean_temperature = mean_temperature.where(mask_by_fgroup.sel({CoordinatesLabels.functional_group: fgroup}))
-        average_temperature.append(mean_temperature)
+    # Layers are gathered and weighted for all functional groups at once by a compiled function. The layer labels are
+    # translated to positions once and the result is wrapped in a DataArray at the end, which avoids building xarray
+    # indexes and temporary arrays for each operation.
+    z_dim = temperature.cf.axes["Z"][0]
+    layer_index = temperature.get_index(z_dim)
+    day_position = layer_index.get_indexer(day_layer.data)
+    night_position = layer_index.get_indexer(night_layer.data)
+    if (day_position < 0).any() or (night_position < 0).any():
+        msg = f"Some day/night layers of the functional groups are not in the {z_dim} coordinate of the temperature."
+        raise ValueError(msg)
+
+    # The layer axis is moved last and the arrays are made C-contiguous so the layers of a cell are adjacent in memory
+    # and the compiled function is always specialized for the same layout.
+    dtype = _average_temperature_dtype(state)
+    temperature = temperature.transpose(..., z_dim)
+    space_dims = temperature.dims[:-1]
+    space_shape = temperature.shape[:-1]
+    # The day length can miss some of the temperature dimensions (e.g. longitude).
+    day_length = xr.broadcast(day_length, temperature.isel({z_dim: 0}, drop=True))[0].transpose(*space_dims)
+    average_temperature = _mix_layers(
+        np.ascontiguousarray(temperature.data, dtype=dtype).reshape(-1, temperature.shape[-1]),
+        np.ascontiguousarray(day_length.data, dtype=dtype).reshape(-1),
+        day_position,
+        night_position,
+    )
+    average_temperature = xr.DataArray(
+        average_temperature.reshape(day_position.size, *space_shape),
+        dims=(CoordinatesLabels.functional_group, *space_dims),
+        coords={
+            **temperature.drop_vars(z_dim).coords,
+            CoordinatesLabels.functional_group: day_layer[CoordinatesLabels.functional_group],
+        },
+    )
 
-    return xr.concat(average_temperature, dim=CoordinatesLabels.functional_group.value)
+    # The mask is much smaller than the result (no time axis). Skip the masking when it is all True.
+    if not mask_by_fgroup.all():
+        average_temperature = average_temperature.where(mask_by_fgroup)
+    return average_temperature
 
 
 def average_temperature_template(chunk: dict | None = None) -> ForcingTemplate:
@@ -53,6 +121,7 @@ def average_temperature_template(chunk: dict | None = None) -> ForcingTemplate:
         dims=[CoordinatesLabels.functional_group, CoordinatesLabels.time, CoordinatesLabels.Y, CoordinatesLabels.X],
         attrs=average_temperature_by_fgroup_desc,
         chunks=chunk,
+        dtype=_average_temperature_dtype,
     )
 
 
@@ -11,6 +11,7 @@ from seapopym.logging.custom_logger import logger
 from seapopym.model.base_model import BaseModel
 from seapopym.plotter import base_functions as pfunctions
 from seapopym.standard.coordinates import reorder_dims
+from seapopym.standard.labels import ForcingLabels
 from seapopym.standard.types import SeapopymState
 from seapopym.writer import base_functions as wfunctions
 
@@ -28,27 +29,28 @@ class NoTransportModel(BaseModel):
         self._configuration = configuration
         self.state = apply_mask_to_state(reorder_dims(configuration.model_parameters))
 
-        chunk = self.configuration.environment_parameters.chunk.as_dict()
+        self._chunk = configuration.environment_parameters.chunk.as_dict()
+        self._client_parameter = configuration.environment_parameters.client
 
         self._kernel = Kernel(
             [
-                generator.global_mask_kernel(chunk=chunk),
-                generator.mask_by_fgroup_kernel(chunk=chunk),
+                generator.global_mask_kernel(chunk=self._chunk),
+                generator.mask_by_fgroup_kernel(chunk=self._chunk),
                 generator.day_length_kernel(
-                    chunk=chunk, angle_horizon_sun=configuration.kernel_parameters.angle_horizon_sun
+                    chunk=self._chunk, angle_horizon_sun=configuration.kernel_parameters.angle_horizon_sun
                 ),
-                generator.average_temperature_kernel(chunk=chunk),
-                generator.apply_coefficient_to_primary_production_kernel(chunk=chunk),
-                generator.min_temperature_kernel(chunk=chunk),
-                generator.mask_temperature_kernel(chunk=chunk),
-                generator.cell_area_kernel(chunk=chunk),
-                generator.mortality_field_kernel(chunk=chunk),
+                generator.average_temperature_kernel(chunk=self._chunk),
+                generator.apply_coefficient_to_primary_production_kernel(chunk=self._chunk),
+                generator.min_temperature_kernel(chunk=self._chunk),
+                generator.mask_temperature_kernel(chunk=self._chunk),
+                generator.cell_area_kernel(chunk=self._chunk),
+                generator.mortality_field_kernel(chunk=self._chunk),
                 generator.production_kernel(
-                    chunk=chunk,
+                    chunk=self._chunk,
                     export_preproduction=configuration.kernel_parameters.compute_preproduction,
                     export_initial_production=configuration.kernel_parameters.compute_initial_conditions,
                 ),
-                generator.biomass_kernel(chunk=chunk),
+                generator.biomass_kernel(chunk=self._chunk),
             ]
         )
 
@@ -60,7 +62,7 @@ class NoTransportModel(BaseModel):
     @property
     def client(self: NoTransportModel) -> Client | None:
         """The dask Client getter."""
-        return self._configuration.environment_parameters.client.client
+        return self._client_parameter.client
 
     @property
     def kernel(self: NoTransportModel) -> Kernel:
@@ -80,11 +82,11 @@ class NoTransportModel(BaseModel):
     def initialize_dask(self: NoTransportModel) -> None:
         """Initialize the client and configure the model to run in distributed mode."""
         logger.info("Initializing the client.")
-        self.configuration.environment_parameters.client.initialize_client()
-        chunk = self.configuration.environment_parameters.chunk.as_dict()
-        self.state = self.state.chunk(chunk)
-        logger.info("Scattering the data to the workers.")
-        self.client.scatter(self.state)
+        self._client_parameter.initialize_client()
+        self.state = self.state.chunk(self._chunk)
+        logger.info("Persisting the forcings on the workers.")
+        forcings = self.state[[ForcingLabels.temperature, ForcingLabels.primary_production]]
+        self.state = self.state.assign(self.client.persist(forcings).data_vars)
 
     def run(self: NoTransportModel) -> None:
         """Run the model. Wrapper of the pre-production, production and post-production processes."""
@@ -94,7 +96,7 @@ class NoTransportModel(BaseModel):
 
     def close(self: NoTransportModel) -> None:
         """Clean up the system. For example, it can be used to close dask.Client."""
-        self.configuration.environment_parameters.client.close_client()
+        self._client_parameter.close_client()
 
     # --- Export functions --- #
 
@@ -1,6 +1,6 @@
 import cf_xarray  # noqa: F401
 import numpy as np
-import pint_xarray  # noqa: F401
+import pandas as pd
 import pytest
 import xarray as xr
 
@@ -9,22 +9,22 @@ from seapopym.standard.labels import ConfigurationLabels, CoordinatesLabels, For
 from seapopym.standard.units import StandardUnitsLabels
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def time_4days() -> xr.DataArray:
-    return coordinates.new_time(xr.cftime_range(start="2020", freq="D", periods=4))
+    return coordinates.new_time(pd.date_range(start="2020", freq="D", periods=4))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def latitude_single():
     return coordinates.new_latitude(np.array([0]))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def longitude_single():
     return coordinates.new_longitude(np.array([0]))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def fgroup_4():
     return xr.DataArray(
         dims=(CoordinatesLabels.functional_group,),
@@ -34,25 +34,22 @@ def fgroup_4():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def layer():
     return coordinates.new_layer()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def daylength(time_4days, latitude_single, longitude_single):
-    return (
-        xr.DataArray(
-            dims=("time", "latitude", "longitude"),
-            coords={"time": time_4days, "latitude": latitude_single, "longitude": longitude_single},
-            data=np.full((time_4days.size, latitude_single.size, longitude_single.size), 0.5, dtype=float),
-        )
-        .pint.quantify(StandardUnitsLabels.time.units)
-        .pint.dequantify()
+    return xr.DataArray(
+        dims=("time", "latitude", "longitude"),
+        coords={"time": time_4days, "latitude": latitude_single, "longitude": longitude_single},
+        data=np.broadcast_to(np.float64(0.5), (time_4days.size, latitude_single.size, longitude_single.size)),
+        attrs={"units": str(StandardUnitsLabels.time.units)},
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def mask_fgroup(fgroup_4, latitude_single, longitude_single):
     return xr.DataArray(
         dims=(CoordinatesLabels.functional_group, "latitude", "longitude"),
@@ -61,7 +58,7 @@ def mask_fgroup(fgroup_4, latitude_single, longitude_single):
             "latitude": latitude_single,
             "longitude": longitude_single,
         },
-        data=np.full((fgroup_4.size, latitude_single.size, longitude_single.size), fill_value=True, dtype=bool),
+        data=np.broadcast_to(np.True_, (fgroup_4.size, latitude_single.size, longitude_single.size)),
     )
 
 
@@ -74,7 +71,7 @@ def global_mask(latitude_single, longitude_single, layer):
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def day_layer():
     return xr.DataArray(
         dims=(CoordinatesLabels.functional_group,),
@@ -83,7 +80,7 @@ def day_layer():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def night_layer():
     return xr.DataArray(
         dims=(CoordinatesLabels.functional_group,),
@@ -92,25 +89,24 @@ def night_layer():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def temperature(time_4days, latitude_single, longitude_single, layer):
-    data = [
-        np.full((time_4days.size, latitude_single.size, longitude_single.size), i, dtype=float)
-        for i in range(layer.size)
-    ]
-    data = np.stack(data, axis=-1)
-    data = xr.DataArray(
+    data = np.broadcast_to(
+        np.arange(layer.size, dtype=float).reshape(1, 1, 1, -1),
+        (time_4days.size, latitude_single.size, longitude_single.size, layer.size),
+    )
+    return xr.DataArray(
         dims=("time", "latitude", "longitude", "layer"),
         coords={"time": time_4days, "latitude": latitude_single, "longitude": longitude_single, "layer": layer},
         data=data,
+        attrs={"units": str(StandardUnitsLabels.temperature.units)},
     )
-    return (data * StandardUnitsLabels.temperature.units).pint.dequantify()
 
 
 @pytest.fixture()
 def primary_production(time_4days, latitude_single, longitude_single):
     data = np.ones((time_4days.size, latitude_single.size, longitude_single.size))
-    data = xr.DataArray(
+    return xr.DataArray(
         dims=("time", "latitude", "longitude"),
         coords={
             "time": time_4days,
@@ -118,8 +114,8 @@ def primary_production(time_4days, latitude_single, longitude_single):
             "longitude": longitude_single,
         },
         data=data,
+        attrs={"units": str(StandardUnitsLabels.production.units)},
     )
-    return (data * StandardUnitsLabels.production.units).pint.dequantify()
 
 
 @pytest.fixture()
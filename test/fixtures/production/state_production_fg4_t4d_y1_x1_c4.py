@@ -1,5 +1,6 @@
 import cf_xarray  # noqa: F401
 import numpy as np
+import pandas as pd
 import pint_xarray  # noqa: F401
 import pytest
 import xarray as xr
@@ -8,22 +9,22 @@ from seapopym.standard import coordinates
 from seapopym.standard.labels import ConfigurationLabels, CoordinatesLabels, ForcingLabels
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def time_4days() -> xr.DataArray:
-    return coordinates.new_time(xr.cftime_range(start="2020", freq="D", periods=4))
+    return coordinates.new_time(pd.date_range(start="2020", freq="D", periods=4))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def latitude_single():
     return coordinates.new_latitude(np.array([0]))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def longitude_single():
     return coordinates.new_longitude(np.array([0]))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def fgroup_4():
     return xr.DataArray(
         dims=(CoordinatesLabels.functional_group,),
@@ -33,7 +34,7 @@ def fgroup_4():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def cohort_4():
     return coordinates.new_cohort(np.arange(4))
 
@@ -162,6 +162,39 @@ class TestConfigurationToDataset:
         assert np.all(cohort_dataset[ConfigurationLabels.max_timestep] == [1, 3, 6, 9, 10])
         assert np.all(cohort_dataset[ConfigurationLabels.mean_timestep] == [1, 2.5, 5, 8, 10])
 
+    def test_build_cohort_dataset_different_cohorts_number(self, fgroup_param):
+        migratory_param = parameter_functional_group.FunctionalGroupUnitMigratoryParameters(day_layer=1, night_layer=2)
+        functional_param = parameter_functional_group.FunctionalGroupUnitRelationParameters(
+            cohorts_timesteps=[2, 2, 1],
+            inv_lambda_max=10,
+            inv_lambda_rate=0.5,
+            temperature_recruitment_max=5,
+            temperature_recruitment_rate=-0.5,
+        )
+        zooplankton = parameter_functional_group.FunctionalGroupUnit(
+            name="zooplankton", energy_transfert=0.5, functional_type=functional_param, migratory_type=migratory_param
+        )
+        functional_groups = [*fgroup_param, zooplankton]
+        names = _as_dataset__build_fgroup_dataset(functional_groups=functional_groups)[ConfigurationLabels.fgroup_name]
+        cohort_dataset = _as_dataset__build_cohort_dataset(functional_groups=functional_groups, names=names)
+
+        assert cohort_dataset.sizes[CoordinatesLabels.cohort] == 5
+        fgroup_coord = cohort_dataset[CoordinatesLabels.functional_group]
+        assert np.array_equal(fgroup_coord, [0, 1])
+        assert fgroup_coord.attrs == names[CoordinatesLabels.functional_group].attrs
+
+        expected = {
+            ConfigurationLabels.timesteps_number: [[1, 2, 3, 3, 1], [2, 2, 1, np.nan, np.nan]],
+            ConfigurationLabels.min_timestep: [[1, 2, 4, 7, 10], [1, 3, 5, np.nan, np.nan]],
+            ConfigurationLabels.max_timestep: [[1, 3, 6, 9, 10], [2, 4, 5, np.nan, np.nan]],
+            ConfigurationLabels.mean_timestep: [[1, 2.5, 5, 8, 10], [1.5, 3.5, 5, np.nan, np.nan]],
+        }
+        for name, values in expected.items():
+            variable = cohort_dataset[name]
+            assert variable.dtype == np.float64
+            assert variable.dims == (CoordinatesLabels.functional_group, CoordinatesLabels.cohort)
+            np.testing.assert_array_equal(variable.to_numpy(), values)
+
     def test_as_dataset(self, forcing_param, fgroup_param):
         dataset = as_dataset(forcing_parameters=forcing_param, functional_groups=fgroup_param)
 
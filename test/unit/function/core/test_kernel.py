@@ -0,0 +1,15 @@
+import pytest
+import xarray as xr
+
+from seapopym.function.core.kernel import Kernel
+from seapopym.function.generator.day_length import day_length_kernel
+from seapopym.standard.labels import ForcingLabels
+
+
+class TestKernel:
+    def test_kernel_does_not_overwrite_state(self, state_preprod_fg4_t4d_y1_x1_z3):
+        day_length = state_preprod_fg4_t4d_y1_x1_z3[ForcingLabels.day_length]
+        state = state_preprod_fg4_t4d_y1_x1_z3.assign({ForcingLabels.day_length: day_length.copy(data=day_length / 2)})
+        kernel = Kernel([day_length_kernel()])
+        with pytest.raises(xr.MergeError):
+            kernel.run(state)
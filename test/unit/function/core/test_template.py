@@ -1,3 +1,5 @@
+import numpy as np
+
 from seapopym.function.core.template import ForcingTemplate
 
 
@@ -20,3 +22,13 @@ class TestForcingTemplateTemplate:
         )
         res = res.generate(state_preprod_fg4_t4d_y1_x1_z3)
         assert res.chunks == ((1,), (1,), (1, 1, 1))  # dim y = 1, dim x = 1, dim z = 3
+
+    def test_template_dtype(self, state_preprod_fg4_t4d_y1_x1_z3):
+        res = ForcingTemplate(
+            name="test",
+            dims=["Y", "X", "Z"],
+            attrs={"units": "meter"},
+            dtype=lambda _: np.float32,
+        )
+        res = res.generate(state_preprod_fg4_t4d_y1_x1_z3)
+        assert res.dtype == np.float32
@@ -1,9 +1,10 @@
 import cf_xarray  # noqa: F401
 import numpy as np
+import pytest
 import xarray as xr
 
 from seapopym.function.generator.average_temperature import average_temperature_kernel
-from seapopym.standard.labels import CoordinatesLabels
+from seapopym.standard.labels import ConfigurationLabels, CoordinatesLabels, ForcingLabels
 
 
 class TestAverageTemperature:
@@ -16,9 +17,10 @@ class TestAverageTemperature:
             assert dim in results.cf
 
         shape = tuple(state_preprod_fg4_t4d_y1_x1_z3.cf[dim].size for dim in dims)
-        assert results.shape == shape
-        assert results.dtype == float
-        assert np.array_equal(results.cf.isel(T=0, Y=0, X=0), [0, 0.5, 1.0, 0.5])
+        data = results.transpose(CoordinatesLabels.functional_group, "time", "latitude", "longitude").to_numpy()
+        assert data.shape == shape
+        assert data.dtype == float
+        np.testing.assert_allclose(data[:, 0, 0, 0], [0, 0.5, 1.0, 0.5])
         assert len(results.attrs) > 0
 
     def test_average_temperature_chunked(self, state_preprod_fg4_t4d_y1_x1_z3):
@@ -31,7 +33,47 @@ class TestAverageTemperature:
         for dim in dims:
             assert dim in results.cf
         shape = tuple(state_preprod_fg4_t4d_y1_x1_z3.cf[dim].size for dim in dims)
-        assert results.shape == shape
-        assert results.dtype == float
-        assert np.array_equal(results.cf.isel(T=0, Y=0, X=0), [0, 0.5, 1.0, 0.5])
+        data = results.transpose(CoordinatesLabels.functional_group, "time", "latitude", "longitude").to_numpy()
+        assert data.shape == shape
+        assert data.dtype == float
+        assert results.dtype == data.dtype
+        np.testing.assert_allclose(data[:, 0, 0, 0], [0, 0.5, 1.0, 0.5])
         assert len(results.attrs) > 0
+
+    def test_average_temperature_day_length_without_longitude(self, state_preprod_fg4_t4d_y1_x1_z3):
+        day_length = state_preprod_fg4_t4d_y1_x1_z3[ForcingLabels.day_length].isel(longitude=0, drop=True)
+        state = state_preprod_fg4_t4d_y1_x1_z3.assign({ForcingLabels.day_length: day_length})
+        kernel = average_temperature_kernel()
+        results = kernel.run(state)
+        data = results.transpose(CoordinatesLabels.functional_group, "time", "latitude", "longitude").to_numpy()
+        np.testing.assert_allclose(data[:, 0, 0, 0], [0, 0.5, 1.0, 0.5])
+
+    def test_average_temperature_unknown_layer(self, state_preprod_fg4_t4d_y1_x1_z3):
+        state = state_preprod_fg4_t4d_y1_x1_z3.copy()
+        state[ConfigurationLabels.day_layer] = state[ConfigurationLabels.day_layer] + 10
+        kernel = average_temperature_kernel()
+        with pytest.raises(ValueError, match="layers"):
+            kernel.run(state)
+
+    @pytest.mark.parametrize(
+        ("dtype", "scale", "expected_dtype", "expected_values"),
+        [
+            (np.float32, 1, np.float32, [0, 0.5, 1.0, 0.5]),
+            (np.int64, 10, np.float64, [0, 5.0, 10.0, 5.0]),
+        ],
+    )
+    @pytest.mark.parametrize("chunk", [None, {CoordinatesLabels.Y: 1, CoordinatesLabels.X: 1}])
+    def test_average_temperature_dtype(
+        self, state_preprod_fg4_t4d_y1_x1_z3, dtype, scale, expected_dtype, expected_values, chunk
+    ):
+        temperature = state_preprod_fg4_t4d_y1_x1_z3[ForcingLabels.temperature]
+        temperature = temperature.copy(data=(temperature.data * scale).astype(dtype))
+        state = state_preprod_fg4_t4d_y1_x1_z3.assign({ForcingLabels.temperature: temperature})
+        if chunk is not None:
+            state = state.cf.chunk(chunk)
+        kernel = average_temperature_kernel(chunk=chunk)
+        results = kernel.run(state)
+        data = results.transpose(CoordinatesLabels.functional_group, "time", "latitude", "longitude").to_numpy()
+        assert results.dtype == expected_dtype
+        assert data.dtype == results.dtype
+        np.testing.assert_allclose(data[:, 0, 0, 0], expected_values, rtol=1e-6)